@@ -1,51 +1,261 @@
-from flask import Flask, render_template, Response, jsonify, request
+from flask import Flask, render_template, Response, jsonify, request, stream_with_context
 import cv2
-import json
+import numpy as np
+import orjson
+import threading
 import time
-from datetime import datetime
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from pose_processor import PoseProcessor
 import os
 
+# libjpeg-turbo SIMD encoder is ~2-4x faster than cv2.imencode;
+# fall back to OpenCV when PyTurboJPEG/libturbojpeg is not installed
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):
+    turbo_jpeg = None
+
+JPEG_QUALITY = 70
+INFERENCE_FPS = 15  # pose inference cadence; streaming stays at camera rate
+METRICS_BUFFER_SIZE = 1800  # per-exercise history cap (~1 min at 30 fps)
+IDLE_DIFF_THRESHOLD = 40000  # L1 norm on the 32x18 thumbnail below which a frame counts as unchanged
+
+# MJPEG part framing, built once instead of per frame
+_BOUNDARY = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+_TRAILER = b'\r\n'
+
+# Opt-in CUDA preprocessing. MediaPipe inference runs on the CPU, so the
+# frame has to come back to host memory either way; only enable this on
+# CUDA builds of OpenCV where the CPU is the bottleneck.
+USE_CUDA_PREPROCESS = (os.getenv('USE_CUDA_PREPROCESS') == '1'
+                       and hasattr(cv2, 'cuda')
+                       and cv2.cuda.getCudaEnabledDeviceCount() > 0)
+
 app = Flask(__name__)
 
 # Global variables
-pose_processor = PoseProcessor()
-current_exercise = None
+# Complexity 0 selects the lite BlazePose model, the fastest variant
+# MediaPipe ships; 1/2 trade speed for landmark accuracy
+pose_processor = PoseProcessor(
+    model_complexity=int(os.getenv('POSE_MODEL_COMPLEXITY', '0'))
+)
+
+@dataclass(frozen=True)
+class State:
+    """Immutable snapshot of the active exercise.
+
+    Writers swap in a fresh instance (one atomic store), so readers in
+    the streaming loop take a consistent snapshot without locking.
+    """
+    exercise: str = None
+    counter_id: int = 0
+
+state = State()
+
+# Signals SSE clients whenever a new metrics sample lands
+metrics_condition = threading.Condition()
+metrics_version = 0
+
+# Wall-clock anchor taken once; per-frame timestamps are monotonic
+# floats and only get formatted to ISO strings at serialization time
+SESSION_START = datetime.now()
+SESSION_START_MONO = time.monotonic()
+
+def mono_to_iso(ts):
+    """Convert a monotonic timestamp to a wall-clock ISO string"""
+    return (SESSION_START + timedelta(seconds=ts - SESSION_START_MONO)).isoformat()
+
 session_data = {
-    'start_time': datetime.now().isoformat(),
+    'start_time': SESSION_START.isoformat(),
     'exercises': {},
     'athlete_info': {}
 }
 
+class MetricRing:
+    """Fixed-capacity structure-of-arrays store for per-frame metrics.
+
+    Numeric metric fields are written in place into a preallocated
+    float32 matrix (one row per frame) plus a timestamp vector, so
+    recording a frame allocates nothing once the field layout is known.
+    """
+    def __init__(self, capacity=METRICS_BUFFER_SIZE):
+        self.capacity = capacity
+        self.fields = None
+        self.values = None
+        self.timestamps = np.empty(capacity, np.float64)
+        self.head = 0
+        self.count = 0
+        self.last = {}
+
+    def append(self, ts, metrics):
+        if self.fields is None:
+            # Field layout is fixed by the first sample carrying numeric
+            # fields; early frames yield {} until the inference worker
+            # publishes a detection, so those only refresh `last` and the
+            # layout stays open until real metrics arrive
+            fields = tuple(k for k, v in metrics.items()
+                           if isinstance(v, (int, float)))
+            if not fields:
+                self.last = metrics
+                return
+            self.fields = fields
+            self.values = np.empty((self.capacity, len(self.fields)), np.float32)
+        row = self.head
+        self.timestamps[row] = ts
+        values = self.values[row]
+        for i, field in enumerate(self.fields):
+            values[i] = metrics.get(field, 0)
+        self.head = (row + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.last = metrics
+
+    def latest(self):
+        """Return (timestamp, metrics dict) for the newest sample"""
+        return self.timestamps[(self.head - 1) % self.capacity], self.last
+
+    def to_payload(self):
+        """Materialize the history oldest-first for serialization"""
+        start = (self.head - self.count) % self.capacity
+        order = (start + np.arange(self.count)) % self.capacity
+        return {
+            'fields': list(self.fields or ()),
+            'timestamps': [mono_to_iso(ts) for ts in self.timestamps[order]],
+            'values': self.values[order] if self.values is not None else [],
+        }
+
+    def __len__(self):
+        return self.count
+
+class FrameGrabber:
+    """Capture camera frames on a background thread"""
+    def __init__(self, source=0):
+        self.cap = cv2.VideoCapture(source)
+        # Keep the driver queue shallow so we always see a fresh frame
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.lock = threading.Lock()
+        self.latest = None
+        self.running = self.cap.isOpened()
+        # Two alternating destination buffers: retrieve() writes into the
+        # one not currently published as `latest`, so steady-state capture
+        # allocates nothing
+        self._bufs = [None, None]
+        self._idx = 0
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        # camera.read() blocks ~1/fps, so grabbing here lets pose
+        # inference and JPEG encoding overlap with camera I/O
+        while self.running:
+            if not self.cap.grab():
+                self.running = False
+                break
+            buf = self._bufs[self._idx]
+            if buf is None:
+                success, frame = self.cap.retrieve()
+            else:
+                success, frame = self.cap.retrieve(buf)
+            if success:
+                self._bufs[self._idx] = frame
+                self._idx ^= 1
+                with self.lock:
+                    self.latest = frame
+
+    def read(self):
+        """Return the most recent frame (or None before first capture)"""
+        with self.lock:
+            return self.latest
+
+    def stop(self):
+        self.running = False
+        self.thread.join(timeout=1)
+        self.cap.release()
+
 def generate_frames():
     """Generate video frames for streaming"""
-    camera = cv2.VideoCapture(0)
-    
-    while True:
-        success, frame = camera.read()
-        if not success:
-            break
-        else:
-            # Process frame
-            frame = cv2.flip(frame, 1)
-            
-            if current_exercise:
-                frame, metrics = pose_processor.process_frame(frame, current_exercise)
-                
-                # Update session data
-                session_data['exercises'][current_exercise] = {
-                    'metrics': metrics,
-                    'timestamp': datetime.now().isoformat()
-                }
+    global metrics_version
+    grabber = FrameGrabber(0)
+    last_metrics = {}
+    last_infer_ts = 0.0
+    flip_buf = None
+    prev_small = None
+    prev_jpeg = None
+    gpu_frame = cv2.cuda_GpuMat() if USE_CUDA_PREPROCESS else None
+    gpu_flipped = cv2.cuda_GpuMat() if USE_CUDA_PREPROCESS else None
+
+    try:
+        while grabber.running:
+            frame = grabber.read()
+            if frame is None:
+                # First frame not captured yet
+                time.sleep(0.005)
+                continue
+
+            # Mirror into a reused buffer instead of allocating a fresh
+            # HxWx3 array (~2.7 MB at 720p) every frame
+            if flip_buf is None or flip_buf.shape != frame.shape:
+                flip_buf = np.empty_like(frame)
+            if USE_CUDA_PREPROCESS:
+                gpu_frame.upload(frame)
+                cv2.cuda.flip(gpu_frame, 1, gpu_flipped)
+                frame = gpu_flipped.download(flip_buf)
+            else:
+                frame = cv2.flip(frame, 1, dst=flip_buf)
+
+            snapshot = state
+            if not snapshot.exercise:
+                # Idle preview: reuse the cached JPEG while the scene is
+                # static instead of re-encoding an identical frame
+                small = cv2.resize(frame, (32, 18))
+                if (prev_jpeg is not None and prev_small is not None and
+                        cv2.norm(small, prev_small, cv2.NORM_L1) < IDLE_DIFF_THRESHOLD):
+                    time.sleep(1.0 / 30)
+                    yield _BOUNDARY
+                    yield prev_jpeg
+                    yield _TRAILER
+                    continue
+                prev_small = small
+
+            if snapshot.exercise:
+                # Pose inference is the bottleneck, so run it at
+                # INFERENCE_FPS and stream the in-between frames as-is
+                now = time.monotonic()
+                if now - last_infer_ts >= 1.0 / INFERENCE_FPS:
+                    frame, last_metrics = pose_processor.process_frame(frame, snapshot.exercise)
+                    last_infer_ts = now
+                elif 'count' in last_metrics:
+                    cv2.putText(frame, f"Count: {last_metrics['count']}", (10, 30),
+                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+
+                # Update session data; the ring bounds memory for long
+                # sessions and a row write into the SoA matrix keeps
+                # allocation and string formatting off the per-frame path
+                history = session_data['exercises'].setdefault(
+                    snapshot.exercise, MetricRing())
+                history.append(time.monotonic(), last_metrics)
+                with metrics_condition:
+                    metrics_version += 1
+                    metrics_condition.notify_all()
             
             # Encode frame
-            ret, buffer = cv2.imencode('.jpg', frame)
-            frame = buffer.tobytes()
-            
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
-    
-    camera.release()
+            if turbo_jpeg:
+                frame = turbo_jpeg.encode(frame, quality=JPEG_QUALITY, pixel_format=TJPF_BGR)
+            else:
+                ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+                # PEP 3333 requires bytes chunks, so the copy out of the
+                # encode buffer is unavoidable at the WSGI boundary
+                frame = buffer.tobytes()
+            prev_jpeg = frame
+
+            # Separate yields become separate WSGI chunks, so the JPEG
+            # payload is never copied into a joined bytes object
+            yield _BOUNDARY
+            yield frame
+            yield _TRAILER
+    finally:
+        grabber.stop()
 
 @app.route('/')
 def index():
@@ -55,52 +265,88 @@ def index():
 @app.route('/video_feed')
 def video_feed():
     """Video streaming route"""
-    return Response(generate_frames(),
-                    mimetype='multipart/x-mixed-replace; boundary=frame')
+    response = Response(generate_frames(),
+                        mimetype='multipart/x-mixed-replace; boundary=frame')
+    # Hand the generator straight to the WSGI server; Flask must not
+    # buffer or re-wrap the MJPEG chunks
+    response.direct_passthrough = True
+    return response
 
 @app.route('/api/set_exercise', methods=['POST'])
 def set_exercise():
     """Set current exercise"""
-    global current_exercise
+    global state
     data = request.json
-    current_exercise = data.get('exercise')
-    pose_processor.reset_counter(current_exercise)
-    return jsonify({'status': 'success', 'exercise': current_exercise})
-
-@app.route('/api/get_metrics')
-def get_metrics():
-    """Get current exercise metrics"""
-    if current_exercise and current_exercise in session_data['exercises']:
-        return jsonify({
-            'exercise': current_exercise,
-            'metrics': session_data['exercises'][current_exercise]['metrics'],
-            'timestamp': datetime.now().isoformat()
-        })
-    return jsonify({'exercise': None, 'metrics': {}})
+    state = replace(state, exercise=data.get('exercise'),
+                    counter_id=state.counter_id + 1)
+    pose_processor.reset_counter(state.exercise)
+    return jsonify({'status': 'success', 'exercise': state.exercise})
+
+def _current_metrics():
+    """Build the metrics payload for the active exercise"""
+    snapshot = state
+    history = session_data['exercises'].get(snapshot.exercise)
+    if snapshot.exercise and history:
+        ts, metrics = history.latest()
+        return {
+            'exercise': snapshot.exercise,
+            'metrics': metrics,
+            'timestamp': mono_to_iso(ts)
+        }
+    return {'exercise': None, 'metrics': {}}
+
+@app.route('/api/metrics_stream')
+def metrics_stream():
+    """Push metrics over SSE instead of having clients poll"""
+    def sse_gen():
+        last_seen = 0
+        while True:
+            with metrics_condition:
+                # The timeout doubles as a keepalive for quiet periods
+                metrics_condition.wait_for(
+                    lambda: metrics_version != last_seen, timeout=5)
+                last_seen = metrics_version
+            yield b'data: ' + orjson.dumps(_current_metrics()) + b'\n\n'
+
+    response = Response(stream_with_context(sse_gen()),
+                        mimetype='text/event-stream')
+    response.direct_passthrough = True
+    return response
 
 @app.route('/api/save_session', methods=['POST'])
 def save_session():
     """Save session data"""
     session_data['end_time'] = datetime.now().isoformat()
     session_data['athlete_info'] = request.json.get('athlete_info', {})
-    
+
+    # Materialize the metric rings for serialization; the value matrix
+    # stays a numpy array and orjson's OPT_SERIALIZE_NUMPY handles it
+    payload = dict(session_data)
+    payload['exercises'] = {
+        exercise: history.to_payload()
+        for exercise, history in session_data['exercises'].items()
+    }
+
     # Save to file
+    os.makedirs('sessions', exist_ok=True)
     filename = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(f"sessions/{filename}", 'w') as f:
-        json.dump(session_data, f, indent=4)
+    with open(f"sessions/{filename}", 'wb') as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     return jsonify({'status': 'success', 'filename': filename})
 
 @app.route('/api/reset')
 def reset_exercise():
     """Reset current exercise counter"""
-    if current_exercise:
-        pose_processor.reset_counter(current_exercise)
+    if state.exercise:
+        pose_processor.reset_counter(state.exercise)
     return jsonify({'status': 'success'})
 
 if __name__ == '__main__':
-    # Create sessions directory
-    os.makedirs('sessions', exist_ok=True)
-    
-    # Run app
-    app.run(debug=True, host='0.0.0.0', port=3000)
+    # Run app (dev server). In production use gunicorn so MJPEG clients
+    # don't monopolize the interpreter:
+    #   gunicorn --worker-class gevent --workers 1 --bind 0.0.0.0:3000 app:app
+    # Debug/reloader stay off unless asked for: the reloader forks a
+    # second process holding its own copy of the pose model
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', use_reloader=False,
+            host='0.0.0.0', port=3000)
@@ -1,70 +1,202 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response
+import functools
+import math
 import numpy as np
-import pandas as pd
-import plotly.graph_objs as go
-import plotly.utils
 import json
+import orjson
+from collections import namedtuple
 from datetime import datetime, timedelta
 import hashlib
 import io
 import base64
-from scipy import signal
+import bisect
 from scipy.stats import zscore
-import random
 import os
 
+# flask-compress is optional; without it responses go out uncompressed
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# The mock video hash is a constant; computing four MD5s per
+# /api/audit_logs hit bought nothing
+MOCK_VIDEO_HASH = hashlib.md5(b'mock_video_data').hexdigest()
+
 app = Flask(__name__)
+if Compress is not None:
+    Compress(app)
+
+# Endpoints whose payloads are deterministic for at least a minute;
+# letting browsers cache them drops repeat requests entirely
+_CACHEABLE_PATHS = frozenset({
+    '/api/performance_metrics',
+    '/api/computed_metrics',
+    '/api/benchmarking',
+    '/api/audit_logs'
+})
+
+@app.after_request
+def add_cache_headers(response):
+    if request.path in _CACHEABLE_PATHS:
+        response.headers.setdefault('Cache-Control', 'public, max-age=60')
+    return response
+
+def fast_json(obj):
+    """Serialize with orjson; ndarrays pass straight through without
+    tolist() boxing"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+                    mimetype='application/json')
+
+# numba is optional; without it the kernels fall back to vectorized NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _stats4(a):
+        """Single fused pass: (min, max, mean, std) of a 1-D array"""
+        mn = a[0]
+        mx = a[0]
+        total = 0.0
+        total_sq = 0.0
+        for v in a:
+            mn = min(mn, v)
+            mx = max(mx, v)
+            total += v
+            total_sq += v * v
+        n = a.shape[0]
+        mean = total / n
+        return mn, mx, mean, math.sqrt(max(total_sq / n - mean * mean, 0.0))
+
+    @njit(cache=True, fastmath=True)
+    def _count_minima(a, threshold):
+        """Count local minima below threshold in one fused pass"""
+        count = 0
+        for i in range(1, a.shape[0] - 1):
+            if a[i] < threshold and a[i] < a[i - 1] and a[i + 1] >= a[i]:
+                count += 1
+        return count
+
+    # Warm the JIT at import so the first request doesn't pay the compile
+    _warm = np.zeros(2, dtype=np.float32)
+    _stats4(_warm)
+    _count_minima(_warm, 0.0)
+else:
+    def _stats4(a):
+        return float(a.min()), float(a.max()), float(a.mean()), float(a.std())
+
+    _count_minima = None
+
+# Shared PCG64 generator: faster than the legacy np.random.* global
+# RandomState and able to draw float32 directly
+_rng = np.random.default_rng()
+
+# Joint-angle synthesis parameters (knee, hip, ankle rows), shaped
+# (3, 1) so they broadcast over a (3, N) batch
+_ANGLE_OFFSETS = np.array([[160.0], [170.0], [90.0]], dtype=np.float32)
+_ANGLE_AMPS = np.array([[20.0], [15.0], [10.0]], dtype=np.float32)
+_ANGLE_OMEGAS = (2 * np.pi / np.array([[1.5], [1.8], [1.2]])).astype(np.float32)
+_ANGLE_PHASES = np.array([[0.0], [np.pi / 2], [0.0]], dtype=np.float32)  # hip uses cos = sin(x + pi/2)
+_ANGLE_SIGMAS = np.array([[2.0], [2.0], [1.5]], dtype=np.float32)
 
 # Mock Data Generation Functions
+_SERIES_FIELDS = ('time', 'displacement', 'velocity', 'acceleration',
+                  'knee_angle', 'hip_angle', 'ankle_angle')
+
+@functools.lru_cache(maxsize=8)
 def generate_time_series_data(duration=10, fps=30):
-    """Generate mock biomechanical time series data"""
-    t = np.linspace(0, duration, duration * fps)
+    """Generate mock biomechanical time series data.
+
+    Cached per (duration, fps): every API endpoint used to regenerate
+    the same mock dataset (RNG draws, trig, two np.gradient passes) on
+    each request. All seven signals live as rows of one contiguous
+    (7, N) float32 block, so per-signal reductions stream a single
+    cache-friendly run of memory; the returned dict maps field names to
+    read-only row views of that block.
+    """
+    n = duration * fps
+    series = np.empty((7, n), dtype=np.float32)
+    t = series[0]
+    t[:] = np.linspace(0, duration, n, dtype=np.float32)
     
-    # Displacement (jump motion)
-    displacement = np.where(
-        (t > 2) & (t < 8), 
-        0.5 * np.sin(2 * np.pi * (t - 2) / 2) ** 2 + np.random.normal(0, 0.02, len(t)),
-        np.random.normal(0, 0.01, len(t))
-    )
+    # Displacement (jump motion): baseline noise everywhere, with the
+    # jump arc added only on the active window. np.where evaluated both
+    # branches over the full array; the masked form computes the sin
+    # term (and its extra noise draw) for ~60% fewer samples.
+    # Note sin(2*pi*(t-2)/2) == sin(pi*(t-2)).
+    displacement = series[1]
+    displacement[:] = 0.01 * _rng.standard_normal(n, dtype=np.float32)
+    active = (t > 2) & (t < 8)
+    t_active = t[active] - 2
+    displacement[active] += (0.5 * np.sin(np.pi * t_active) ** 2
+                             + 0.02 * _rng.standard_normal(t_active.size, dtype=np.float32))
     
-    # Velocity and acceleration
-    velocity = np.gradient(displacement, t)
-    acceleration = np.gradient(velocity, t)
+    # Velocity and acceleration from the closed-form derivatives of the
+    # jump arc (d/dt 0.5*sin^2(pi*u) = (pi/2)*sin(2*pi*u)), zero outside
+    # the active window. Replaces two full np.gradient passes, which
+    # also double-differenced the synthetic noise into garbage.
+    series[2:4] = 0.0
+    series[2, active] = (np.pi / 2) * np.sin(2 * np.pi * t_active)
+    series[3, active] = np.pi ** 2 * np.cos(2 * np.pi * t_active)
     
-    # Joint angles (knee, hip, ankle)
-    knee_angle = 160 + 20 * np.sin(2 * np.pi * t / 1.5) + np.random.normal(0, 2, len(t))
-    hip_angle = 170 + 15 * np.cos(2 * np.pi * t / 1.8) + np.random.normal(0, 2, len(t))
-    ankle_angle = 90 + 10 * np.sin(2 * np.pi * t / 1.2) + np.random.normal(0, 1.5, len(t))
+    # Joint angles (knee, hip, ankle) synthesized as one (3, N) batch:
+    # a single sin over the phase matrix and one noise draw instead of
+    # three of each
+    angles = series[4:7]
+    np.sin(_ANGLE_OMEGAS * t + _ANGLE_PHASES, out=angles)
+    angles *= _ANGLE_AMPS
+    angles += _ANGLE_OFFSETS
+    angles += _ANGLE_SIGMAS * _rng.standard_normal((3, n), dtype=np.float32)
     
+    # Rows are shared across requests, so freeze the block before
+    # handing out views
+    series.setflags(write=False)
+    return dict(zip(_SERIES_FIELDS, series))
+
+@functools.lru_cache(maxsize=1)
+def raw_data_lists():
+    """Python-list view of the cached time series, converted once.
+
+    .tolist() boxes every float into a Python object; doing that per
+    request for 7 arrays of 300 samples was pure rework.
+    """
+    data = generate_time_series_data()
+    return {key: array.tolist() for key, array in data.items()}
+
+_KEYPOINTS = ('head', 'neck', 'left_shoulder', 'right_shoulder', 'left_elbow',
+              'right_elbow', 'left_wrist', 'right_wrist', 'left_hip', 'right_hip',
+              'left_knee', 'right_knee', 'left_ankle', 'right_ankle')
+
+PoseCoordinates = namedtuple('PoseCoordinates', ['keypoints', 'x', 'y', 'confidence'])
+
+def generate_pose_coordinates(frames=300):  # 10 seconds at 30fps
+    """Generate mock pose coordinates as (frames, keypoints) arrays.
+
+    Three vectorized draws replace the old frames x keypoints x 3 loop
+    of random.uniform calls and its nested per-frame dicts.
+    """
+    size = (frames, len(_KEYPOINTS))
+    return PoseCoordinates(
+        keypoints=_KEYPOINTS,
+        x=_rng.uniform(100, 500, size),
+        y=_rng.uniform(100, 400, size),
+        confidence=_rng.uniform(0.7, 1.0, size)
+    )
+
+def pose_frame_to_dict(poses, frame):
+    """Materialize one frame of pose data in the nested-dict form"""
     return {
-        'time': t,
-        'displacement': displacement,
-        'velocity': velocity,
-        'acceleration': acceleration,
-        'knee_angle': knee_angle,
-        'hip_angle': hip_angle,
-        'ankle_angle': ankle_angle
+        kp: {
+            'x': float(poses.x[frame, i]),
+            'y': float(poses.y[frame, i]),
+            'confidence': float(poses.confidence[frame, i])
+        }
+        for i, kp in enumerate(poses.keypoints)
     }
 
-def generate_pose_coordinates():
-    """Generate mock pose coordinate data"""
-    keypoints = ['head', 'neck', 'left_shoulder', 'right_shoulder', 'left_elbow', 
-                'right_elbow', 'left_wrist', 'right_wrist', 'left_hip', 'right_hip',
-                'left_knee', 'right_knee', 'left_ankle', 'right_ankle']
-    
-    poses = []
-    for frame in range(300):  # 10 seconds at 30fps
-        pose_data = {}
-        for kp in keypoints:
-            pose_data[kp] = {
-                'x': random.uniform(100, 500),
-                'y': random.uniform(100, 400),
-                'confidence': random.uniform(0.7, 1.0)
-            }
-        poses.append(pose_data)
-    
-    return poses
-
 def generate_athlete_data():
     """Generate mock athlete performance data"""
     return {
@@ -105,16 +237,26 @@ def calculate_jump_height(displacement_data):
     return max_displacement * 100  # Convert to cm
 
 def count_repetitions(joint_angle_data, threshold=120):
-    """Count repetitions using threshold crossing"""
-    peaks, _ = signal.find_peaks(-joint_angle_data, height=-threshold)
-    return len(peaks)
+    """Count repetitions as local minima below the threshold angle"""
+    if _count_minima is not None:
+        return int(_count_minima(joint_angle_data, threshold))
+    # Sign changes of the first difference mark the local minima; this
+    # is scipy.signal.find_peaks(-data, height=-threshold) without the
+    # Python-level peak bookkeeping
+    falling = np.signbit(np.diff(joint_angle_data))
+    minima = falling[:-1] & ~falling[1:] & (joint_angle_data[1:-1] < threshold)
+    return int(minima.sum())
+
+# Bounds for the three simulated cheat metrics (repeated frames,
+# unnatural motion, metadata inconsistency)
+_CHEAT_LOWS = np.zeros(3)
+_CHEAT_HIGHS = np.array([0.1, 0.2, 0.05])
 
 def detect_cheating(data):
     """Mock cheat detection algorithm"""
-    # Simulate various cheat detection metrics
-    repeated_frames = random.uniform(0, 0.1)
-    unnatural_motion = random.uniform(0, 0.2)
-    metadata_inconsistency = random.uniform(0, 0.05)
+    # Simulate various cheat detection metrics in one vectorized draw
+    repeated_frames, unnatural_motion, metadata_inconsistency = \
+        _rng.uniform(_CHEAT_LOWS, _CHEAT_HIGHS).tolist()
     
     overall_score = (repeated_frames + unnatural_motion + metadata_inconsistency) / 3
     
@@ -126,6 +268,128 @@ def detect_cheating(data):
         'is_suspicious': overall_score > 0.1
     }
 
+# Plot layout skeletons as plain dicts: for simple scatter/bar traces
+# the go.Figure -> PlotlyJSONEncoder pipeline only re-derives these same
+# dicts on every request
+_DISPLACEMENT_LAYOUT = {
+    'title': 'Displacement Over Time',
+    'xaxis': {'title': 'Time (s)'},
+    'yaxis': {'title': 'Displacement (m)'}
+}
+_ANGLES_LAYOUT = {
+    'title': 'Joint Angles Over Time',
+    'xaxis': {'title': 'Time (s)'},
+    'yaxis': {'title': 'Angle (degrees)'}
+}
+_PROGRESS_LAYOUT = {
+    'title': 'Performance Progress Over Time',
+    'xaxis': {'title': 'Date'},
+    'yaxis': {'title': 'Overall Score'}
+}
+
+@functools.lru_cache(maxsize=1)
+def performance_plots():
+    """Plot JSON for the cached time series, rendered once"""
+    lists = raw_data_lists()
+    displacement_plot = json.dumps({
+        'data': [{
+            'type': 'scatter',
+            'mode': 'lines',
+            'name': 'Displacement',
+            'x': lists['time'],
+            'y': lists['displacement']
+        }],
+        'layout': _DISPLACEMENT_LAYOUT
+    })
+    angles_plot = json.dumps({
+        'data': [
+            {'type': 'scatter', 'name': 'Knee', 'x': lists['time'], 'y': lists['knee_angle']},
+            {'type': 'scatter', 'name': 'Hip', 'x': lists['time'], 'y': lists['hip_angle']},
+            {'type': 'scatter', 'name': 'Ankle', 'x': lists['time'], 'y': lists['ankle_angle']}
+        ],
+        'layout': _ANGLES_LAYOUT
+    })
+    return displacement_plot, angles_plot
+
+# Static mock payloads, frozen to bytes once at import so the routes
+# serving them skip dict building and JSON encoding entirely
+_AUDIT_JSON = json.dumps({
+    'audit_logs': [
+        {
+            'timestamp': '2024-09-16 10:30:25',
+            'action': 'Video Upload',
+            'video_hash': MOCK_VIDEO_HASH,
+            'model_version': 'v2.1.4',
+            'reviewer': 'AI System',
+            'status': 'Validated'
+        },
+        {
+            'timestamp': '2024-09-16 10:31:12',
+            'action': 'Pose Estimation',
+            'video_hash': MOCK_VIDEO_HASH,
+            'model_version': 'PoseNet v1.8.2',
+            'reviewer': 'AI System',
+            'status': 'Completed'
+        },
+        {
+            'timestamp': '2024-09-16 10:32:45',
+            'action': 'Cheat Detection',
+            'video_hash': MOCK_VIDEO_HASH,
+            'model_version': 'CheatDetector v3.0.1',
+            'reviewer': 'AI System',
+            'status': 'No Issues Detected'
+        },
+        {
+            'timestamp': '2024-09-16 10:33:20',
+            'action': 'Human Review',
+            'video_hash': MOCK_VIDEO_HASH,
+            'model_version': 'N/A',
+            'reviewer': 'Dr. Smith',
+            'status': 'Approved'
+        }
+    ],
+    'integrity_summary': {
+        'total_tests': 156,
+        'validated_tests': 152,
+        'flagged_tests': 4,
+        'integrity_score': 97.4,
+        'last_audit': '2024-09-15 18:00:00'
+    }
+}).encode()
+_AUDIT_ETAG = hashlib.md5(_AUDIT_JSON).hexdigest()
+
+_VALIDATION_SCORE_KEYS = ('pose_accuracy', 'kinematic_consistency',
+                          'heuristic_validation', 'cheat_detection_confidence',
+                          'overall_validation')
+_VALIDATION_SCORE_LOWS = np.array([0.85, 0.80, 0.75, 0.88, 0.82])
+_VALIDATION_SCORE_HIGHS = np.array([0.98, 0.95, 0.92, 0.99, 0.96])
+
+_FEATURE_IMPORTANCE = {
+    'joint_angles': 0.35,
+    'velocity_profile': 0.28,
+    'pose_consistency': 0.22,
+    'temporal_alignment': 0.15
+}
+
+_VALIDATION_BAR = {
+    'type': 'bar',
+    'x': list(_VALIDATION_SCORE_KEYS),
+    'marker': {'color': 'lightblue'}
+}
+_VALIDATION_LAYOUT = {
+    'title': 'AI Validation Scores',
+    'yaxis': {'title': 'Confidence Score', 'range': [0, 1]}
+}
+
+_IMPORTANCE_PLOT_JSON = json.dumps({
+    'data': [{
+        'type': 'pie',
+        'labels': list(_FEATURE_IMPORTANCE.keys()),
+        'values': list(_FEATURE_IMPORTANCE.values())
+    }],
+    'layout': {'title': 'Feature Importance'}
+})
+
 # Routes
 @app.route('/')
 def dashboard():
@@ -135,44 +399,12 @@ def dashboard():
 @app.route('/api/performance_metrics')
 def performance_metrics():
     """API endpoint for performance metrics data"""
-    data = generate_time_series_data()
-    
-    # Create Plotly figures
-    fig_displacement = go.Figure()
-    fig_displacement.add_trace(go.Scatter(
-        x=data['time'], 
-        y=data['displacement'],
-        mode='lines',
-        name='Displacement'
-    ))
-    fig_displacement.update_layout(
-        title='Displacement Over Time',
-        xaxis_title='Time (s)',
-        yaxis_title='Displacement (m)'
-    )
-    
-    fig_angles = go.Figure()
-    fig_angles.add_trace(go.Scatter(x=data['time'], y=data['knee_angle'], name='Knee'))
-    fig_angles.add_trace(go.Scatter(x=data['time'], y=data['hip_angle'], name='Hip'))
-    fig_angles.add_trace(go.Scatter(x=data['time'], y=data['ankle_angle'], name='Ankle'))
-    fig_angles.update_layout(
-        title='Joint Angles Over Time',
-        xaxis_title='Time (s)',
-        yaxis_title='Angle (degrees)'
-    )
-    
-    return jsonify({
-        'displacement_plot': json.dumps(fig_displacement, cls=plotly.utils.PlotlyJSONEncoder),
-        'angles_plot': json.dumps(fig_angles, cls=plotly.utils.PlotlyJSONEncoder),
-        'raw_data': {
-            'time': data['time'].tolist(),
-            'displacement': data['displacement'].tolist(),
-            'velocity': data['velocity'].tolist(),
-            'acceleration': data['acceleration'].tolist(),
-            'knee_angle': data['knee_angle'].tolist(),
-            'hip_angle': data['hip_angle'].tolist(),
-            'ankle_angle': data['ankle_angle'].tolist()
-        }
+    displacement_plot, angles_plot = performance_plots()
+
+    return fast_json({
+        'displacement_plot': displacement_plot,
+        'angles_plot': angles_plot,
+        'raw_data': generate_time_series_data()
     })
 
 @app.route('/api/computed_metrics')
@@ -184,180 +416,160 @@ def computed_metrics():
     jump_height = calculate_jump_height(data['displacement'])
     repetitions = count_repetitions(data['knee_angle'])
     
-    # Kinematic statistics
+    # Kinematic statistics: _stats4 streams each signal through cache
+    # once (fused min/max/mean/std under numba, vectorized fallback)
+    v_min, v_max, v_mean, v_std = _stats4(data['velocity'])
+    a_min, a_max, a_mean, a_std = _stats4(data['acceleration'])
+    k_min, k_max, k_mean, _ = _stats4(data['knee_angle'])
+    h_min, h_max, h_mean, _ = _stats4(data['hip_angle'])
+    an_min, an_max, an_mean, _ = _stats4(data['ankle_angle'])
+
     stats = {
         'velocity': {
-            'mean': np.mean(data['velocity']),
-            'max': np.max(data['velocity']),
-            'min': np.min(data['velocity']),
-            'std': np.std(data['velocity'])
+            'mean': float(v_mean),
+            'max': float(v_max),
+            'min': float(v_min),
+            'std': float(v_std)
         },
         'acceleration': {
-            'mean': np.mean(data['acceleration']),
-            'max': np.max(data['acceleration']),
-            'min': np.min(data['acceleration']),
-            'std': np.std(data['acceleration'])
+            'mean': float(a_mean),
+            'max': float(a_max),
+            'min': float(a_min),
+            'std': float(a_std)
         },
         'joint_angles': {
             'knee': {
-                'mean': np.mean(data['knee_angle']),
-                'max': np.max(data['knee_angle']),
-                'min': np.min(data['knee_angle']),
-                'range': np.max(data['knee_angle']) - np.min(data['knee_angle'])
+                'mean': float(k_mean),
+                'max': float(k_max),
+                'min': float(k_min),
+                'range': float(k_max - k_min)
             },
             'hip': {
-                'mean': np.mean(data['hip_angle']),
-                'max': np.max(data['hip_angle']),
-                'min': np.min(data['hip_angle']),
-                'range': np.max(data['hip_angle']) - np.min(data['hip_angle'])
+                'mean': float(h_mean),
+                'max': float(h_max),
+                'min': float(h_min),
+                'range': float(h_max - h_min)
             },
             'ankle': {
-                'mean': np.mean(data['ankle_angle']),
-                'max': np.max(data['ankle_angle']),
-                'min': np.min(data['ankle_angle']),
-                'range': np.max(data['ankle_angle']) - np.min(data['ankle_angle'])
+                'mean': float(an_mean),
+                'max': float(an_max),
+                'min': float(an_min),
+                'range': float(an_max - an_min)
             }
         }
     }
     
     return jsonify({
-        'jump_height': round(jump_height, 2),
+        'jump_height': round(float(jump_height), 2),
         'repetitions': repetitions,
         'kinematic_stats': stats
     })
 
+# Cheat-score bar chart: the x labels and layout never change, so they
+# are baked into a template and only the y values / bar colors are
+# spliced in per request
+_CHEAT_LAYOUT_JSON = json.dumps({
+    'title': {'text': 'Cheat Detection Scores'},
+    'yaxis': {'title': {'text': 'Confidence Score'}, 'range': [0, 1]}
+})
+_CHEAT_TEMPLATE = ('{"data":[{"type":"bar",'
+                   '"x":["Repeated Frames","Unnatural Motion","Metadata Issues"],'
+                   '"y":%s,"marker":{"color":%s}}],"layout":%s}')
+
 @app.route('/api/cheat_detection')
 def cheat_detection():
     """API endpoint for cheat detection results"""
     cheat_data = detect_cheating(None)
-    
-    # Create confidence score visualization
-    fig = go.Figure(data=[
-        go.Bar(
-            x=['Repeated Frames', 'Unnatural Motion', 'Metadata Issues'],
-            y=[cheat_data['repeated_frames'], cheat_data['unnatural_motion'], 
-               cheat_data['metadata_inconsistency']],
-            marker_color=['red' if x > 0.1 else 'green' for x in [
-                cheat_data['repeated_frames'], cheat_data['unnatural_motion'],
-                cheat_data['metadata_inconsistency']
-            ]]
-        )
-    ])
-    fig.update_layout(
-        title='Cheat Detection Scores',
-        yaxis_title='Confidence Score',
-        yaxis_range=[0, 1]
-    )
-    
+    scores = [cheat_data['repeated_frames'], cheat_data['unnatural_motion'],
+              cheat_data['metadata_inconsistency']]
+    colors = ['red' if x > 0.1 else 'green' for x in scores]
+
+    cheat_plot = _CHEAT_TEMPLATE % (json.dumps(scores), json.dumps(colors),
+                                    _CHEAT_LAYOUT_JSON)
+
     return jsonify({
         'cheat_scores': cheat_data,
-        'cheat_plot': json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+        'cheat_plot': cheat_plot
     })
 
+# Mock normative data for 25-year-old males
+_BENCH_METRICS = ('jump_height', 'push_ups', 'speed')
+_NORM_MEANS = np.array([42.5, 25.0, 8.2])
+_NORM_STDS = np.array([5.2, 4.0, 0.8])
+
+# Percentile-to-grade table: bisect on the bounds indexes the label
+_GRADE_BOUNDS = (50, 70, 85)
+_GRADE_LABELS = ('D', 'C', 'B', 'A')
+
 @app.route('/api/benchmarking')
 def benchmarking():
     """API endpoint for benchmarking and normative comparisons"""
     athlete_data = generate_athlete_data()
-    
-    # Mock normative data for 25-year-old males
-    normative_data = {
-        'jump_height': {'mean': 42.5, 'std': 5.2},
-        'push_ups': {'mean': 25, 'std': 4},
-        'speed': {'mean': 8.2, 'std': 0.8}
-    }
-    
-    # Calculate percentiles and z-scores
+
+    # Calculate percentiles and z-scores in one pass over the metrics
     current_performance = athlete_data['test_history'][-1]
-    
+    values = np.array([current_performance[m] for m in _BENCH_METRICS])
+    z_scores = (values - _NORM_MEANS) / _NORM_STDS
+    percentiles = 50 + 50 * np.tanh(z_scores / 2)  # Approximate percentile
+
     benchmarks = {}
-    for metric in ['jump_height', 'push_ups', 'speed']:
-        value = current_performance[metric]
-        norm_mean = normative_data[metric]['mean']
-        norm_std = normative_data[metric]['std']
-        
-        z_score = (value - norm_mean) / norm_std
-        percentile = 50 + 50 * np.tanh(z_score / 2)  # Approximate percentile
-        
+    for metric, value, z_score, percentile in zip(
+            _BENCH_METRICS, values.tolist(), z_scores.tolist(), percentiles.tolist()):
         benchmarks[metric] = {
             'value': value,
             'z_score': round(z_score, 2),
             'percentile': round(percentile, 1),
-            'grade': 'A' if percentile > 85 else 'B' if percentile > 70 else 'C' if percentile > 50 else 'D'
+            'grade': _GRADE_LABELS[bisect.bisect_left(_GRADE_BOUNDS, percentile)]
         }
     
     # Progress over time
     dates = [test['date'] for test in athlete_data['test_history']]
     scores = [test['overall_score'] for test in athlete_data['test_history']]
     
-    fig_progress = go.Figure()
-    fig_progress.add_trace(go.Scatter(
-        x=dates, 
-        y=scores,
-        mode='lines+markers',
-        name='Progress'
-    ))
-    fig_progress.update_layout(
-        title='Performance Progress Over Time',
-        xaxis_title='Date',
-        yaxis_title='Overall Score'
-    )
-    
+    progress_plot = json.dumps({
+        'data': [{
+            'type': 'scatter',
+            'mode': 'lines+markers',
+            'name': 'Progress',
+            'x': dates,
+            'y': scores
+        }],
+        'layout': _PROGRESS_LAYOUT
+    })
+
     return jsonify({
         'benchmarks': benchmarks,
         'athlete_data': athlete_data,
-        'progress_plot': json.dumps(fig_progress, cls=plotly.utils.PlotlyJSONEncoder)
+        'progress_plot': progress_plot
     })
 
 @app.route('/api/ai_validation')
 def ai_validation():
     """API endpoint for AI model validation scores"""
-    # Mock AI validation scores
-    validation_scores = {
-        'pose_accuracy': random.uniform(0.85, 0.98),
-        'kinematic_consistency': random.uniform(0.80, 0.95),
-        'heuristic_validation': random.uniform(0.75, 0.92),
-        'cheat_detection_confidence': random.uniform(0.88, 0.99),
-        'overall_validation': random.uniform(0.82, 0.96)
-    }
-    
-    # Feature importance
-    feature_importance = {
-        'joint_angles': 0.35,
-        'velocity_profile': 0.28,
-        'pose_consistency': 0.22,
-        'temporal_alignment': 0.15
-    }
-    
-    # Create validation score chart
-    fig_validation = go.Figure(data=[
-        go.Bar(
-            x=list(validation_scores.keys()),
-            y=list(validation_scores.values()),
-            marker_color='lightblue'
-        )
-    ])
-    fig_validation.update_layout(
-        title='AI Validation Scores',
-        yaxis_title='Confidence Score',
-        yaxis_range=[0, 1]
-    )
-    
-    # Feature importance chart
-    fig_importance = go.Figure(data=[
-        go.Pie(
-            labels=list(feature_importance.keys()),
-            values=list(feature_importance.values())
-        )
-    ])
-    fig_importance.update_layout(title='Feature Importance')
-    
+    # Only the five random scores vary per request; everything else is
+    # spliced in from the frozen scaffolding above
+    scores = _rng.uniform(_VALIDATION_SCORE_LOWS, _VALIDATION_SCORE_HIGHS)
+    validation_scores = dict(zip(_VALIDATION_SCORE_KEYS, scores.tolist()))
+
+    validation_plot = json.dumps({
+        'data': [dict(_VALIDATION_BAR, y=list(validation_scores.values()))],
+        'layout': _VALIDATION_LAYOUT
+    })
+
     return jsonify({
         'validation_scores': validation_scores,
-        'feature_importance': feature_importance,
-        'validation_plot': json.dumps(fig_validation, cls=plotly.utils.PlotlyJSONEncoder),
-        'importance_plot': json.dumps(fig_importance, cls=plotly.utils.PlotlyJSONEncoder)
+        'feature_importance': _FEATURE_IMPORTANCE,
+        'validation_plot': validation_plot,
+        'importance_plot': _IMPORTANCE_PLOT_JSON
     })
 
+_POINTS_DATES = (np.datetime64('2024-08-01') + np.arange(30)).astype(str).tolist()
+_POINTS_LAYOUT = {
+    'title': {'text': 'Points Accumulation Over Time'},
+    'xaxis': {'title': {'text': 'Date'}},
+    'yaxis': {'title': {'text': 'Total Points'}}
+}
+
 @app.route('/api/gamification')
 def gamification():
     """API endpoint for gamification and progress tracking"""
@@ -379,107 +591,59 @@ def gamification():
     }
     
     # Points over time
-    dates = pd.date_range(start='2024-08-01', periods=30, freq='D')
-    points = np.cumsum(np.random.randint(10, 100, 30))
-    
-    fig_points = go.Figure()
-    fig_points.add_trace(go.Scatter(
-        x=dates,
-        y=points,
-        mode='lines+markers',
-        name='Points'
-    ))
-    fig_points.update_layout(
-        title='Points Accumulation Over Time',
-        xaxis_title='Date',
-        yaxis_title='Total Points'
-    )
-    
+    points = np.cumsum(_rng.integers(10, 100, 30))
+
+    points_plot = json.dumps({
+        'data': [{
+            'type': 'scatter',
+            'mode': 'lines+markers',
+            'name': 'Points',
+            'x': _POINTS_DATES,
+            'y': points.tolist()
+        }],
+        'layout': _POINTS_LAYOUT
+    })
+
     return jsonify({
         'gamification_data': gamification_data,
-        'points_plot': json.dumps(fig_points, cls=plotly.utils.PlotlyJSONEncoder)
+        'points_plot': points_plot
     })
 
 @app.route('/api/audit_logs')
 def audit_logs():
     """API endpoint for data integrity and audit logs"""
-    # Mock audit log data
-    audit_logs = [
-        {
-            'timestamp': '2024-09-16 10:30:25',
-            'action': 'Video Upload',
-            'video_hash': hashlib.md5(b'mock_video_data').hexdigest(),
-            'model_version': 'v2.1.4',
-            'reviewer': 'AI System',
-            'status': 'Validated'
-        },
-        {
-            'timestamp': '2024-09-16 10:31:12',
-            'action': 'Pose Estimation',
-            'video_hash': hashlib.md5(b'mock_video_data').hexdigest(),
-            'model_version': 'PoseNet v1.8.2',
-            'reviewer': 'AI System',
-            'status': 'Completed'
-        },
-        {
-            'timestamp': '2024-09-16 10:32:45',
-            'action': 'Cheat Detection',
-            'video_hash': hashlib.md5(b'mock_video_data').hexdigest(),
-            'model_version': 'CheatDetector v3.0.1',
-            'reviewer': 'AI System',
-            'status': 'No Issues Detected'
-        },
-        {
-            'timestamp': '2024-09-16 10:33:20',
-            'action': 'Human Review',
-            'video_hash': hashlib.md5(b'mock_video_data').hexdigest(),
-            'model_version': 'N/A',
-            'reviewer': 'Dr. Smith',
-            'status': 'Approved'
-        }
-    ]
-    
-    # Data integrity summary
-    integrity_summary = {
-        'total_tests': 156,
-        'validated_tests': 152,
-        'flagged_tests': 4,
-        'integrity_score': 97.4,
-        'last_audit': '2024-09-15 18:00:00'
-    }
-    
-    return jsonify({
-        'audit_logs': audit_logs,
-        'integrity_summary': integrity_summary
-    })
+    # The payload never changes, so a matching ETag turns repeat hits
+    # into empty 304s
+    response = Response(_AUDIT_JSON, mimetype='application/json')
+    response.set_etag(_AUDIT_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response.make_conditional(request)
 
-@app.route('/api/export_data')
-def export_data():
-    """Export metrics and graphs for offline use"""
-    # Generate comprehensive data export
+@functools.lru_cache(maxsize=1)
+def export_template():
+    """Export body rendered once, with placeholders for the per-request
+    parts (timestamp and the random cheat scores)"""
     data = generate_time_series_data()
-    athlete_data = generate_athlete_data()
-    
-    export_data = {
-        'timestamp': datetime.now().isoformat(),
-        'athlete_info': athlete_data,
-        'time_series_data': {
-            'time': data['time'].tolist(),
-            'displacement': data['displacement'].tolist(),
-            'velocity': data['velocity'].tolist(),
-            'acceleration': data['acceleration'].tolist(),
-            'knee_angle': data['knee_angle'].tolist(),
-            'hip_angle': data['hip_angle'].tolist(),
-            'ankle_angle': data['ankle_angle'].tolist()
-        },
+    return json.dumps({
+        'timestamp': '__TS__',
+        'athlete_info': generate_athlete_data(),
+        'time_series_data': raw_data_lists(),
         'computed_metrics': {
-            'jump_height': calculate_jump_height(data['displacement']),
+            'jump_height': float(calculate_jump_height(data['displacement'])),
             'repetitions': count_repetitions(data['knee_angle'])
         },
-        'cheat_detection': detect_cheating(None)
-    }
-    
-    return jsonify(export_data)
+        'cheat_detection': '__CHEAT__'
+    }).encode()
+
+@app.route('/api/export_data')
+def export_data():
+    """Export metrics and graphs for offline use"""
+    # The ~50 KB body is a cached template; per request we only patch in
+    # the timestamp and the cheat scores
+    body = export_template()
+    body = body.replace(b'"__TS__"', json.dumps(datetime.now().isoformat()).encode())
+    body = body.replace(b'"__CHEAT__"', json.dumps(detect_cheating(None)).encode())
+    return Response(body, mimetype='application/json')
 
 # HTML Template (embedded for single-file solution)
 html_template = """
@@ -869,12 +1033,25 @@ html_template = """
 # Flask app configuration
 app.template_folder = 'templates'
 
-# Create templates directory and save HTML template
-if not os.path.exists('templates'):
-    os.makedirs('templates')
+def _ensure_template():
+    """Materialize templates/dashboard.html, skipping the write when
+    the on-disk copy already matches.
 
-with open('templates/dashboard.html', 'w') as f:
-    f.write(html_template)
+    Writing at import time cost a disk write on every import (and on
+    every reload in dev); the content hash makes repeats a no-op.
+    """
+    path = os.path.join('templates', 'dashboard.html')
+    digest = hashlib.sha1(html_template.encode()).digest()
+    try:
+        with open(path, 'rb') as f:
+            if hashlib.sha1(f.read()).digest() == digest:
+                return
+    except OSError:
+        pass
+    os.makedirs('templates', exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(html_template)
 
 if __name__ == '__main__':
+    _ensure_template()
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,124 +1,392 @@
 import cv2
+import math
+from concurrent.futures import ThreadPoolExecutor
 import mediapipe as mp
 import numpy as np
+import os
+import queue
+import threading
 from datetime import datetime
 import time
 
-class PoseProcessor:
+# Optional Tasks-API backend with the GPU delegate; opt in by pointing
+# POSE_LANDMARKER_MODEL at a pose_landmarker .task bundle. The default
+# Solutions backend runs BlazePose on CPU via XNNPACK.
+try:
+    from mediapipe.framework.formats import landmark_pb2
+    from mediapipe.tasks.python import BaseOptions
+    from mediapipe.tasks.python import vision as mp_vision
+except ImportError:
+    mp_vision = None
+
+# numba is optional; without it the kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(**kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True, fastmath=True)
+def _angle_deg(ax, ay, bx, by, cx, cy):
+    """Angle at vertex b of triangle (a, b, c), in degrees"""
+    radians = math.atan2(cy - by, cx - bx) - math.atan2(ay - by, ax - bx)
+    angle = abs(radians) * 57.29577951308232  # 180/pi
+    if angle > 180.0:
+        angle = 360.0 - angle
+    return angle
+
+@njit(cache=True, fastmath=True)
+def _rep_update(angle, down_thresh, up_thresh, count, direction):
+    """Half-rep state machine shared by the angle-threshold exercises"""
+    if angle < down_thresh:
+        if direction == 0:
+            count += 0.5
+            direction = 1
+    elif angle > up_thresh:
+        if direction == 1:
+            count += 0.5
+            direction = 0
+    return count, direction
+
+# Warm the JITs at import so the first frame doesn't pay the compile cost
+_angle_deg(0.0, 0.0, 1.0, 0.0, 1.0, 1.0)
+_rep_update(100.0, 90.0, 160.0, 0.0, 0)
+
+def _landmarks_to_xy(landmarks, w, h, out):
+    """Fill `out` (33, 2) with all landmarks in pixel space"""
+    # fromiter reads the 66 protobuf fields in a single C loop (filling
+    # a persistent buffer instead would need a Python-level loop); the
+    # scale into pixels lands in the reused output buffer
+    xy = np.fromiter((v for lm in landmarks for v in (lm.x, lm.y)),
+                     dtype=np.float32, count=66).reshape(33, 2)
+    np.multiply(xy, (w, h), out=out)
+    return out
+
+def compute_angles(xy, triples):
+    """Interior angles at the middle index of each (a, b, c) triple,
+    in degrees, computed for all triples in one vectorized pass"""
+    a = xy[triples[:, 0]]
+    b = xy[triples[:, 1]]
+    c = xy[triples[:, 2]]
+    ang = np.degrees(np.arctan2(c[:, 1] - b[:, 1], c[:, 0] - b[:, 0])
+                     - np.arctan2(a[:, 1] - b[:, 1], a[:, 0] - b[:, 0]))
+    return np.abs((ang + 180.0) % 360.0 - 180.0)
+
+# Joint-index triples per exercise (shoulder/elbow/wrist etc.)
+_PUSH_UP_TRIPLES = np.array([[11, 13, 15], [11, 23, 25]], dtype=np.int32)
+
+# Shared pool for scoring several streams at once; MediaPipe's graph
+# runs in C++ and releases the GIL, so independent PoseProcessor
+# instances scale across physical cores
+_executor = None
+
+def process_concurrent(jobs):
+    """Score several (processor, frame, exercise) jobs in parallel.
+
+    Each job must use its own PoseProcessor; results are returned in
+    job order as (frame, metrics) tuples.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = [_executor.submit(proc.process_frame, frame, exercise)
+               for proc, frame, exercise in jobs]
+    return [future.result() for future in futures]
+
+# Per-exercise counter state. Slotted classes: attribute access is a
+# slot-descriptor read instead of two dict hashes per touch, and the
+# fields are spelled out in one place.
+class _RepState:
+    """Up/down repetition counter"""
+    __slots__ = ('count', 'direction')
+
     def __init__(self):
+        # count stays a float so the _rep_update kernel sees one stable
+        # type signature
+        self.count = 0.0
+        self.direction = 0
+
+class _PlankState:
+    """Plank hold timing"""
+    __slots__ = ('start_time', 'elapsed', 'total')
+
+    def __init__(self):
+        self.start_time = None
+        self.elapsed = 0.0
+        self.total = 0.0
+
+class _JumpState:
+    """Vertical-jump tracking"""
+    __slots__ = ('baseline', 'max_height', 'jumps')
+
+    def __init__(self):
+        self.baseline = None
+        self.max_height = 0
+        self.jumps = 0
+
+class PoseProcessor:
+    # Fresh-state factories, shared by __init__ and reset_counter
+    _INITIAL_STATES = {
+        'jumping_jacks': _RepState,
+        'push_ups': _RepState,
+        'sit_ups': _RepState,
+        'plank': _PlankState,
+        'vertical_jump': _JumpState
+    }
+
+    def __init__(self, model_complexity=1, render=True):
         self.mp_pose = mp.solutions.pose
         self.mp_drawing = mp.solutions.drawing_utils
-        self.pose = self.mp_pose.Pose(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        
-        # Exercise counters
-        self.counters = {
-            'jumping_jacks': {'count': 0, 'direction': 0},
-            'push_ups': {'count': 0, 'direction': 0},
-            'sit_ups': {'count': 0, 'direction': 0},
-            'plank': {'start_time': None, 'elapsed': 0, 'total': 0},
-            'vertical_jump': {'baseline': None, 'max_height': 0, 'jumps': 0}
+        # Skeleton overlay costs ~70 cv2 draw calls per frame; headless
+        # scoring can turn it off
+        self.render = render
+        model_path = os.environ.get('POSE_LANDMARKER_MODEL')
+        self.landmarker = None
+        if model_path and mp_vision is not None:
+            # GPU delegate moves the conv stack off the CPU; falls back
+            # below when no model bundle is configured
+            self.landmarker = mp_vision.PoseLandmarker.create_from_options(
+                mp_vision.PoseLandmarkerOptions(
+                    base_options=BaseOptions(
+                        model_asset_path=model_path,
+                        delegate=BaseOptions.Delegate.GPU),
+                    running_mode=mp_vision.RunningMode.VIDEO,
+                    num_poses=1))
+        else:
+            # Video mode: the pose graph derives the ROI from the
+            # previous frame's landmarks and only re-runs the heavy
+            # person detector when tracking confidence drops below
+            # min_tracking_confidence. Instances are created lazily per
+            # thread (see _get_pose).
+            self._pose_options = {
+                'static_image_mode': False,
+                'model_complexity': model_complexity,
+                'min_detection_confidence': 0.5,
+                'min_tracking_confidence': 0.5
+            }
+            self._pose_local = threading.local()
+        
+        # Drawing styles, built once instead of per frame
+        self._landmark_spec = self.mp_drawing.DrawingSpec(
+            color=(0, 255, 0), thickness=2, circle_radius=3)
+        self._connection_spec = self.mp_drawing.DrawingSpec(
+            color=(0, 255, 255), thickness=2)
+
+        # Inference runs on a worker thread so the capture/stream loop
+        # never blocks on the model. The queue holds at most the newest
+        # frame; _latest carries the most recent detection result.
+        self._infer_queue = queue.Queue(maxsize=1)
+        self._latest = (None, None)
+        self._latest_lock = threading.Lock()
+        # Reused conversion buffers: the half-res BGR scratch stays on
+        # the caller's thread, while RGB buffers cycle through a small
+        # pool so a frame in flight to the worker is never overwritten
+        self._small_bgr = None
+        self._rgb_pool = queue.Queue(maxsize=4)
+        # Opt-in CUDA preprocessing, mirroring the flip path in app.py;
+        # requires an opencv build with cv2.cuda and a visible device
+        self._use_cuda = (os.getenv('POSE_CUDA_PREPROCESS') == '1'
+                          and hasattr(cv2, 'cuda')
+                          and cv2.cuda.getCudaEnabledDeviceCount() > 0)
+        if self._use_cuda:
+            self._gpu_frame = cv2.cuda_GpuMat()
+        self._infer_thread = threading.Thread(target=self._infer_loop, daemon=True)
+        self._infer_thread.start()
+
+        # Persistent landmark buffer; safe to reuse because the
+        # exercise handlers only ever run on the caller's thread
+        self._pts = np.empty((33, 2), dtype=np.float32)
+
+        # Exercise handlers, resolved once instead of a per-frame
+        # if/elif ladder
+        self._handlers = {
+            'jumping_jacks': self.process_jumping_jacks,
+            'push_ups': self.process_push_ups,
+            'sit_ups': self.process_sit_ups,
+            'plank': self.process_plank,
+            'vertical_jump': self.process_vertical_jump
         }
+
+        # Exercise counters
+        self.counters = {name: factory()
+                         for name, factory in self._INITIAL_STATES.items()}
         
+    def _get_pose(self):
+        """Per-thread Solutions Pose instance.
+
+        The graph holds interpreter and tracking state per instance, so
+        sharing one across threads would serialize inference behind
+        MediaPipe's internal lock and interleave two streams' ROI
+        tracking. Thread-local instances keep multi-threaded callers
+        truly parallel; the C++ calculators release the GIL.
+        """
+        pose = getattr(self._pose_local, 'pose', None)
+        if pose is None:
+            pose = self.mp_pose.Pose(**self._pose_options)
+            self._pose_local.pose = pose
+        return pose
+
+    def _detect(self, rgb_frame):
+        """Run whichever backend is active on one RGB frame.
+
+        Returns (landmarks, drawable): the landmark sequence for the
+        exercise math plus whatever draw_landmarks needs, or (None, None)
+        when no pose is found.
+        """
+        if self.landmarker is not None:
+            image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            result = self.landmarker.detect_for_video(
+                image, int(time.monotonic() * 1000))
+            if not result.pose_landmarks:
+                return None, None
+            landmarks = result.pose_landmarks[0]
+            drawable = landmark_pb2.NormalizedLandmarkList(landmark=[
+                landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z)
+                for lm in landmarks
+            ])
+            return landmarks, drawable
+        results = self._get_pose().process(rgb_frame)
+        if not results.pose_landmarks:
+            return None, None
+        return results.pose_landmarks.landmark, results.pose_landmarks
+
+    def _infer_loop(self):
+        """Worker thread: run detection on the newest queued frame"""
+        while True:
+            rgb_frame = self._infer_queue.get()
+            if rgb_frame is None:
+                break
+            result = self._detect(rgb_frame)
+            self._recycle(rgb_frame)
+            with self._latest_lock:
+                self._latest = result
+
+    def _recycle(self, rgb_frame):
+        """Return an RGB buffer to the pool for reuse"""
+        try:
+            self._rgb_pool.put_nowait(rgb_frame)
+        except queue.Full:
+            pass
+
+    def _submit(self, rgb_frame):
+        """Hand a frame to the worker without blocking; when the worker
+        is behind, the stale queued frame is dropped for the new one"""
+        try:
+            self._infer_queue.put_nowait(rgb_frame)
+        except queue.Full:
+            try:
+                stale = self._infer_queue.get_nowait()
+                if stale is not None:
+                    self._recycle(stale)
+            except queue.Empty:
+                pass
+            try:
+                self._infer_queue.put_nowait(rgb_frame)
+            except queue.Full:
+                pass
+
+    def close(self):
+        """Stop the inference worker"""
+        self._submit(None)
+        self._infer_thread.join(timeout=1.0)
+
     def process_frame(self, frame, exercise):
         """Process frame based on exercise type"""
-        # Convert to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.pose.process(rgb_frame)
-        
+        # BlazePose resizes its input to 256x256 internally, so feed it
+        # a half-resolution copy: the BGR->RGB conversion and the graph's
+        # input transfer touch 4x fewer bytes. Landmarks come back
+        # normalized, so drawing and the exercise math keep using the
+        # full-resolution frame.
+        h2, w2 = frame.shape[0] // 2, frame.shape[1] // 2
+        try:
+            rgb_frame = self._rgb_pool.get_nowait()
+            if rgb_frame.shape[:2] != (h2, w2):
+                rgb_frame = np.empty((h2, w2, 3), dtype=np.uint8)
+        except queue.Empty:
+            rgb_frame = np.empty((h2, w2, 3), dtype=np.uint8)
+        if self._use_cuda:
+            # Resize and channel swap fused on the GPU; only the small
+            # RGB result crosses back over PCIe
+            self._gpu_frame.upload(frame)
+            gpu_small = cv2.cuda.resize(self._gpu_frame, (w2, h2),
+                                        interpolation=cv2.INTER_AREA)
+            cv2.cuda.cvtColor(gpu_small, cv2.COLOR_BGR2RGB).download(rgb_frame)
+        else:
+            if self._small_bgr is None or self._small_bgr.shape[:2] != (h2, w2):
+                self._small_bgr = np.empty((h2, w2, 3), dtype=np.uint8)
+            cv2.resize(frame, (w2, h2), dst=self._small_bgr,
+                       interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._small_bgr, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+
+        # Queue the frame for the worker and use the newest completed
+        # detection; the skeleton may trail the video by one frame, but
+        # the stream loop never waits on the model
+        self._submit(rgb_frame)
+        with self._latest_lock:
+            landmarks, drawable = self._latest
+
         # Draw pose
-        if results.pose_landmarks:
-            self.mp_drawing.draw_landmarks(
-                frame, results.pose_landmarks, self.mp_pose.POSE_CONNECTIONS,
-                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=3),
-                self.mp_drawing.DrawingSpec(color=(0, 255, 255), thickness=2)
-            )
-            
-            # Process based on exercise
-            landmarks = results.pose_landmarks.landmark
-            h, w, _ = frame.shape
-            
-            if exercise == 'jumping_jacks':
-                return self.process_jumping_jacks(frame, landmarks, w, h)
-            elif exercise == 'push_ups':
-                return self.process_push_ups(frame, landmarks, w, h)
-            elif exercise == 'sit_ups':
-                return self.process_sit_ups(frame, landmarks, w, h)
-            elif exercise == 'plank':
-                return self.process_plank(frame, landmarks, w, h)
-            elif exercise == 'vertical_jump':
-                return self.process_vertical_jump(frame, landmarks, w, h)
+        if landmarks is not None:
+            if self.render:
+                self.mp_drawing.draw_landmarks(
+                    frame, drawable, self.mp_pose.POSE_CONNECTIONS,
+                    self._landmark_spec, self._connection_spec
+                )
+
+            # Process based on exercise; every method works off one
+            # pixel-space landmark array instead of per-point lists
+            handler = self._handlers.get(exercise)
+            if handler is not None:
+                h, w, _ = frame.shape
+                return handler(frame,
+                               _landmarks_to_xy(landmarks, w, h, self._pts))
         
         return frame, {}
     
-    def process_jumping_jacks(self, frame, landmarks, w, h):
+    def process_jumping_jacks(self, frame, xy):
         """Process jumping jacks"""
         counter = self.counters['jumping_jacks']
         
-        # Get key points
-        left_wrist = landmarks[15]
-        right_wrist = landmarks[16]
-        left_shoulder = landmarks[11]
-        right_shoulder = landmarks[12]
-        left_hip = landmarks[23]
-        right_hip = landmarks[24]
-        
-        # Check if arms are raised
-        arms_up = (left_wrist.y < left_shoulder.y and right_wrist.y < right_shoulder.y)
+        # Check if arms are raised (wrists above shoulders)
+        arms_up = xy[15, 1] < xy[11, 1] and xy[16, 1] < xy[12, 1]
         
         # Check if legs are spread (using hip distance)
-        hip_distance = abs(right_hip.x - left_hip.x) * w
+        hip_distance = abs(xy[24, 0] - xy[23, 0])
         legs_spread = hip_distance > 100  # pixels
         
         # Count logic
         if arms_up and legs_spread:
-            if counter['direction'] == 0:
-                counter['count'] += 0.5
-                counter['direction'] = 1
+            if counter.direction == 0:
+                counter.count += 0.5
+                counter.direction = 1
         else:
-            if counter['direction'] == 1:
-                counter['count'] += 0.5
-                counter['direction'] = 0
+            if counter.direction == 1:
+                counter.count += 0.5
+                counter.direction = 0
         
         metrics = {
-            'count': int(counter['count']),
+            'count': int(counter.count),
             'form_score': 95 if arms_up and legs_spread else 70,
             'status': 'Up' if arms_up else 'Down'
         }
         
         return frame, metrics
     
-    def process_push_ups(self, frame, landmarks, w, h):
+    def process_push_ups(self, frame, xy):
         """Process push-ups"""
         counter = self.counters['push_ups']
         
-        # Calculate arm angle
-        shoulder = [landmarks[11].x * w, landmarks[11].y * h]
-        elbow = [landmarks[13].x * w, landmarks[13].y * h]
-        wrist = [landmarks[15].x * w, landmarks[15].y * h]
-        
-        arm_angle = self.calculate_angle(shoulder, elbow, wrist)
-        
-        # Calculate body alignment
-        hip = [landmarks[23].x * w, landmarks[23].y * h]
-        knee = [landmarks[25].x * w, landmarks[25].y * h]
-        
-        body_angle = self.calculate_angle(shoulder, hip, knee)
+        # Arm angle and body alignment in one batched call
+        arm_angle, body_angle = compute_angles(xy, _PUSH_UP_TRIPLES)
         
         # Count logic
-        if arm_angle < 90:
-            if counter['direction'] == 0:
-                counter['count'] += 0.5
-                counter['direction'] = 1
-        elif arm_angle > 160:
-            if counter['direction'] == 1:
-                counter['count'] += 0.5
-                counter['direction'] = 0
+        counter.count, counter.direction = _rep_update(
+            float(arm_angle), 90.0, 160.0, counter.count, counter.direction)
         
         metrics = {
-            'count': int(counter['count']),
+            'count': int(counter.count),
             'arm_angle': int(arm_angle),
             'body_angle': int(body_angle),
             'form_score': 100 if 160 < body_angle < 190 else 70
@@ -126,125 +394,103 @@ class PoseProcessor:
         
         return frame, metrics
     
-    def process_sit_ups(self, frame, landmarks, w, h):
+    def process_sit_ups(self, frame, xy):
         """Process sit-ups"""
         counter = self.counters['sit_ups']
         
-        # Calculate torso angle
-        shoulder = [landmarks[11].x * w, landmarks[11].y * h]
-        hip = [landmarks[23].x * w, landmarks[23].y * h]
-        knee = [landmarks[25].x * w, landmarks[25].y * h]
-        
-        angle = self.calculate_angle(shoulder, hip, knee)
+        # Torso angle (shoulder-hip-knee); scalar kernel since it's a
+        # single angle
+        angle = _angle_deg(xy[11, 0], xy[11, 1], xy[23, 0], xy[23, 1],
+                           xy[25, 0], xy[25, 1])
         
         # Count logic
-        if angle < 90:
-            if counter['direction'] == 0:
-                counter['count'] += 0.5
-                counter['direction'] = 1
-        elif angle > 150:
-            if counter['direction'] == 1:
-                counter['count'] += 0.5
-                counter['direction'] = 0
+        counter.count, counter.direction = _rep_update(
+            float(angle), 90.0, 150.0, counter.count, counter.direction)
         
         metrics = {
-            'count': int(counter['count']),
+            'count': int(counter.count),
             'angle': int(angle),
             'status': 'Up' if angle < 90 else 'Down'
         }
         
         return frame, metrics
     
-    def process_plank(self, frame, landmarks, w, h):
+    def process_plank(self, frame, xy):
         """Process plank hold"""
         counter = self.counters['plank']
         
-        # Calculate body alignment
-        shoulder = [landmarks[11].x * w, landmarks[11].y * h]
-        hip = [landmarks[23].x * w, landmarks[23].y * h]
-        ankle = [landmarks[27].x * w, landmarks[27].y * h]
-        
-        body_angle = self.calculate_angle(shoulder, hip, ankle)
+        # Body alignment (shoulder-hip-ankle)
+        body_angle = _angle_deg(xy[11, 0], xy[11, 1], xy[23, 0], xy[23, 1],
+                                xy[27, 0], xy[27, 1])
         
         # Check if in plank position
         in_plank = 160 < body_angle < 190
         
+        # One clock read per frame; monotonic is immune to wall-clock
+        # jumps mid-hold
+        now = time.monotonic()
         if in_plank:
-            if counter['start_time'] is None:
-                counter['start_time'] = time.time()
-            counter['elapsed'] = time.time() - counter['start_time']
+            if counter.start_time is None:
+                counter.start_time = now
+            counter.elapsed = now - counter.start_time
         else:
-            if counter['start_time'] is not None:
-                counter['total'] += counter['elapsed']
-                counter['start_time'] = None
-                counter['elapsed'] = 0
+            if counter.start_time is not None:
+                counter.total += counter.elapsed
+                counter.start_time = None
+                counter.elapsed = 0.0
         
-        current_hold = counter['elapsed'] if in_plank else 0
+        current_hold = counter.elapsed if in_plank else 0
         
         metrics = {
             'current_hold': int(current_hold),
-            'total_time': int(counter['total']),
+            'total_time': int(counter.total),
             'body_angle': int(body_angle),
             'in_position': in_plank
         }
         
         return frame, metrics
     
-    def process_vertical_jump(self, frame, landmarks, w, h):
+    def process_vertical_jump(self, frame, xy):
         """Process vertical jump"""
         counter = self.counters['vertical_jump']
         
         # Get hip position
-        hip_y = (landmarks[23].y + landmarks[24].y) / 2 * h
+        hip_y = (xy[23, 1] + xy[24, 1]) / 2
         
         # Set baseline
-        if counter['baseline'] is None:
-            counter['baseline'] = hip_y
+        if counter.baseline is None:
+            counter.baseline = hip_y
         
         # Calculate jump height
-        jump_height = counter['baseline'] - hip_y
+        jump_height = counter.baseline - hip_y
         
         # Detect jump
         if jump_height > 20:  # pixels
-            if counter['max_height'] < jump_height:
-                counter['max_height'] = jump_height
-        elif jump_height < 10 and counter['max_height'] > 20:
+            if counter.max_height < jump_height:
+                counter.max_height = jump_height
+        elif jump_height < 10 and counter.max_height > 20:
             # Landed
-            counter['jumps'] += 1
-            counter['max_height'] = 0
+            counter.jumps += 1
+            counter.max_height = 0
         
         metrics = {
             'current_height': int(jump_height),
-            'max_height': int(counter['max_height']),
-            'jump_count': counter['jumps']
+            'max_height': int(counter.max_height),
+            'jump_count': counter.jumps
         }
         
         return frame, metrics
     
     def calculate_angle(self, a, b, c):
-        """Calculate angle between three points"""
-        a = np.array(a)
-        b = np.array(b)
-        c = np.array(c)
-        
-        radians = np.arctan2(c[1] - b[1], c[0] - b[0]) - \
-                  np.arctan2(a[1] - b[1], a[0] - b[0])
-        angle = np.abs(radians * 180.0 / np.pi)
-        
-        if angle > 180.0:
-            angle = 360 - angle
-        
-        return angle
+        """Calculate angle between three points.
+
+        Scalar path: a direct math.atan2 kernel, cheaper than a numpy
+        ufunc for a single triple. Use compute_angles for batches.
+        """
+        return _angle_deg(a[0], a[1], b[0], b[1], c[0], c[1])
     
     def reset_counter(self, exercise):
         """Reset exercise counter"""
-        if exercise == 'jumping_jacks':
-            self.counters['jumping_jacks'] = {'count': 0, 'direction': 0}
-        elif exercise == 'push_ups':
-            self.counters['push_ups'] = {'count': 0, 'direction': 0}
-        elif exercise == 'sit_ups':
-            self.counters['sit_ups'] = {'count': 0, 'direction': 0}
-        elif exercise == 'plank':
-            self.counters['plank'] = {'start_time': None, 'elapsed': 0, 'total': 0}
-        elif exercise == 'vertical_jump':
-            self.counters['vertical_jump'] = {'baseline': None, 'max_height': 0, 'jumps': 0}
+        factory = self._INITIAL_STATES.get(exercise)
+        if factory is not None:
+            self.counters[exercise] = factory()
@@ -1,6 +1,7 @@
 // Global variables
 let currentExercise = null;
-let metricsUpdateInterval = null;
+let metricsSource = null;
+let lastChartUpdate = 0;
 let recording = false;
 let sessionData = {
     exercises: {}
@@ -50,12 +51,21 @@ function selectExercise(exercise) {
     
     // Update display
     updateExerciseDisplay(exercise);
-    
-    // Start metrics update
-    if (metricsUpdateInterval) {
-        clearInterval(metricsUpdateInterval);
-    }
-    metricsUpdateInterval = setInterval(updateMetrics, 500);
+
+    // Start metrics stream
+    startMetricsStream();
+}
+
+// Subscribe to server-pushed metrics (replaces 500ms polling)
+function startMetricsStream() {
+    if (metricsSource) return;
+    metricsSource = new EventSource('/api/metrics_stream');
+    metricsSource.onmessage = function(event) {
+        const data = JSON.parse(event.data);
+        if (data.exercise === currentExercise) {
+            updateMetrics(data);
+        }
+    };
 }
 
 // Update exercise display
@@ -133,177 +143,177 @@ function updateExerciseDisplay(exercise) {
 }
 
 // Update metrics
-function updateMetrics() {
-    if (!currentExercise) return;
+function updateMetrics(data) {
+    if (!currentExercise || !data.metrics) return;
+    // Update display based on exercise type
+    const metricsContainer = document.getElementById('metricsDisplay');
     
-    fetch('/api/get_metrics')
-        .then(response => response.json())
-        .then(data => {
-            if (data.metrics) {
-                // Update display based on exercise type
-                const metricsContainer = document.getElementById('metricsDisplay');
-                
-                switch(currentExercise) {
-                    case 'jumping_jacks':
-                        metricsContainer.innerHTML = `
-                            <div class="metric-card">
-                                <i class="fas fa-hashtag"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Count</span>
-                                    <span class="metric-value">${data.metrics.count || 0}</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-check-circle"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Form Score</span>
-                                    <span class="metric-value">${data.metrics.form_score || 0}%</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-info-circle"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Status</span>
-                                    <span class="metric-value">${data.metrics.status || 'Ready'}</span>
-                                </div>
-                            </div>
-                        `;
-                        break;
-                        
-                    case 'push_ups':
-                        metricsContainer.innerHTML = `
-                            <div class="metric-card">
-                                <i class="fas fa-hashtag"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Count</span>
-                                    <span class="metric-value">${data.metrics.count || 0}</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-angle-down"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Arm Angle</span>
-                                    <span class="metric-value">${data.metrics.arm_angle || 0}°</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-ruler"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Body Angle</span>
-                                    <span class="metric-value">${data.metrics.body_angle || 0}°</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-check-circle"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Form Score</span>
-                                    <span class="metric-value">${data.metrics.form_score || 0}%</span>
-                                </div>
-                            </div>
-                        `;
-                        break;
-                        
-                    case 'sit_ups':
-                        metricsContainer.innerHTML = `
-                            <div class="metric-card">
-                                <i class="fas fa-hashtag"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Count</span>
-                                    <span class="metric-value">${data.metrics.count || 0}</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-angle-up"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Angle</span>
-                                    <span class="metric-value">${data.metrics.angle || 0}°</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-info-circle"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Status</span>
-                                    <span class="metric-value">${data.metrics.status || 'Ready'}</span>
-                                </div>
-                            </div>
-                        `;
-                        break;
-                        
-                    case 'plank':
-                        metricsContainer.innerHTML = `
-                            <div class="metric-card">
-                                <i class="fas fa-clock"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Current Hold</span>
-                                    <span class="metric-value">${data.metrics.current_hold || 0}s</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-hourglass-half"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Total Time</span>
-                                    <span class="metric-value">${data.metrics.total_time || 0}s</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-ruler"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Body Angle</span>
-                                    <span class="metric-value">${data.metrics.body_angle || 0}°</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-${data.metrics.in_position ? 'check' : 'times'}-circle"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Position</span>
-                                    <span class="metric-value">${data.metrics.in_position ? 'Correct' : 'Adjust'}</span>
-                                </div>
-                            </div>
-                        `;
-                        break;
-                        
-                    case 'vertical_jump':
-                        metricsContainer.innerHTML = `
-                            <div class="metric-card">
-                                <i class="fas fa-arrow-up"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Current Height</span>
-                                    <span class="metric-value">${data.metrics.current_height || 0}px</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-trophy"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Max Height</span>
-                                    <span class="metric-value">${data.metrics.max_height || 0}px</span>
-                                </div>
-                            </div>
-                            <div class="metric-card">
-                                <i class="fas fa-hashtag"></i>
-                                <div class="metric-info">
-                                    <span class="metric-label">Jump Count</span>
-                                    <span class="metric-value">${data.metrics.jump_count || 0}</span>
-                                </div>
-                            </div>
-                        `;
-                        break;
-                }
-                
-                // Store session data
-                if (!sessionData.exercises[currentExercise]) {
-                    sessionData.exercises[currentExercise] = [];
-                }
-                sessionData.exercises[currentExercise].push({
-                    timestamp: new Date(),
-                    metrics: data.metrics
-                });
-                
-                // Update chart
-                updateProgressChart();
-            }
-        });
+    switch(currentExercise) {
+        case 'jumping_jacks':
+            metricsContainer.innerHTML = `
+                <div class="metric-card">
+                    <i class="fas fa-hashtag"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Count</span>
+                        <span class="metric-value">${data.metrics.count || 0}</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-check-circle"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Form Score</span>
+                        <span class="metric-value">${data.metrics.form_score || 0}%</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-info-circle"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Status</span>
+                        <span class="metric-value">${data.metrics.status || 'Ready'}</span>
+                    </div>
+                </div>
+            `;
+            break;
+            
+        case 'push_ups':
+            metricsContainer.innerHTML = `
+                <div class="metric-card">
+                    <i class="fas fa-hashtag"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Count</span>
+                        <span class="metric-value">${data.metrics.count || 0}</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-angle-down"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Arm Angle</span>
+                        <span class="metric-value">${data.metrics.arm_angle || 0}°</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-ruler"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Body Angle</span>
+                        <span class="metric-value">${data.metrics.body_angle || 0}°</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-check-circle"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Form Score</span>
+                        <span class="metric-value">${data.metrics.form_score || 0}%</span>
+                    </div>
+                </div>
+            `;
+            break;
+            
+        case 'sit_ups':
+            metricsContainer.innerHTML = `
+                <div class="metric-card">
+                    <i class="fas fa-hashtag"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Count</span>
+                        <span class="metric-value">${data.metrics.count || 0}</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-angle-up"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Angle</span>
+                        <span class="metric-value">${data.metrics.angle || 0}°</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-info-circle"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Status</span>
+                        <span class="metric-value">${data.metrics.status || 'Ready'}</span>
+                    </div>
+                </div>
+            `;
+            break;
+            
+        case 'plank':
+            metricsContainer.innerHTML = `
+                <div class="metric-card">
+                    <i class="fas fa-clock"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Current Hold</span>
+                        <span class="metric-value">${data.metrics.current_hold || 0}s</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-hourglass-half"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Total Time</span>
+                        <span class="metric-value">${data.metrics.total_time || 0}s</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-ruler"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Body Angle</span>
+                        <span class="metric-value">${data.metrics.body_angle || 0}°</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-${data.metrics.in_position ? 'check' : 'times'}-circle"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Position</span>
+                        <span class="metric-value">${data.metrics.in_position ? 'Correct' : 'Adjust'}</span>
+                    </div>
+                </div>
+            `;
+            break;
+            
+        case 'vertical_jump':
+            metricsContainer.innerHTML = `
+                <div class="metric-card">
+                    <i class="fas fa-arrow-up"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Current Height</span>
+                        <span class="metric-value">${data.metrics.current_height || 0}px</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-trophy"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Max Height</span>
+                        <span class="metric-value">${data.metrics.max_height || 0}px</span>
+                    </div>
+                </div>
+                <div class="metric-card">
+                    <i class="fas fa-hashtag"></i>
+                    <div class="metric-info">
+                        <span class="metric-label">Jump Count</span>
+                        <span class="metric-value">${data.metrics.jump_count || 0}</span>
+                    </div>
+                </div>
+            `;
+            break;
+    }
+    
+    // The stream pushes per inference; sample the chart/session history
+    // at the old 500ms polling rate
+    const now = Date.now();
+    if (now - lastChartUpdate < 500) return;
+    lastChartUpdate = now;
+
+    // Store session data
+    if (!sessionData.exercises[currentExercise]) {
+        sessionData.exercises[currentExercise] = [];
+    }
+    sessionData.exercises[currentExercise].push({
+        timestamp: new Date(),
+        metrics: data.metrics
+    });
+
+    // Update chart
+    updateProgressChart();
 }
 
+
 // Initialize progress chart
 function initProgressChart() {
     const ctx = document.getElementById('progressChart').getContext('2d');